@@ -1,4 +1,5 @@
 import asyncio
+import gc
 import logging
 import sys
 from datetime import datetime, timedelta
@@ -37,6 +38,11 @@ def get_cached_services() -> Tuple[Any, Any, Any, Any, Any]:
     # Create metadata fetcher with dependencies
     metadata_fetcher = make_metadata_fetcher(arxiv_client, pdf_parser, opensearch_client)
 
+    # Exclude the cached services (incl. Docling models) from future GC scans; collect startup garbage first
+    # so it isn't frozen along with them and kept forever
+    gc.collect()
+    gc.freeze()
+
     logger.info("All services initialized and cached with lru_cache")
     return arxiv_client, pdf_parser, database, metadata_fetcher, opensearch_client
 
@@ -193,6 +199,7 @@ def index_papers_to_opensearch(**context):
 
             logger.info(f"Found {len(papers)} papers from today's run to index")
 
+            paper_docs = []
             for paper_row in papers:
                 try:
                     paper = paper_repo.get_by_id(paper_row.id)
@@ -219,23 +226,21 @@ def index_papers_to_opensearch(**context):
                         else str(paper.updated_at),
                     }
 
-                    # Index the document
-                    success = opensearch_client.index_paper(paper_doc)
-
-                    if success:
-                        indexed_count += 1
-                        logger.info(f"Successfully indexed paper: {paper.arxiv_id}")
-                    else:
-                        failed_count += 1
-                        logger.warning(f"Failed to index paper: {paper.arxiv_id}")
+                    paper_docs.append(paper_doc)
 
                 except Exception as e:
                     failed_count += 1
-                    logger.error(f"Error indexing paper {paper_row.id}: {e}")
+                    logger.error(f"Error preparing paper {paper_row.id} for indexing: {e}")
+
+            # Index all documents in bulk requests with a single refresh at the end
+            if paper_docs:
+                bulk_results = opensearch_client.bulk_index_papers(paper_docs)
+                indexed_count += bulk_results["success"]
+                failed_count += bulk_results["failed"]
 
         # Get final index stats
         try:
-            final_stats = opensearch_client.get_index_stats()
+            final_stats = opensearch_client.get_index_stats(force=True)
             total_docs = final_stats.get("document_count", 0) if final_stats else 0
         except Exception:
             total_docs = "unknown"
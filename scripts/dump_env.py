@@ -0,0 +1,37 @@
+"""Compile the project .env file into an importable Python module.
+
+Run at build/deploy time (``make dump-env``) so workers can seed their
+environment from ``src/_env_cache.py`` instead of re-parsing ``.env`` on
+every settings construction.
+"""
+
+import sys
+from pathlib import Path
+from pprint import pformat
+
+from dotenv import dotenv_values
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ENV_FILE_PATH = PROJECT_ROOT / ".env"
+OUTPUT_PATH = PROJECT_ROOT / "src" / "_env_cache.py"
+
+HEADER = '"""Generated by scripts/dump_env.py - do not edit by hand."""\n\n'
+
+
+def dump_env(env_file: Path = ENV_FILE_PATH, output: Path = OUTPUT_PATH) -> int:
+    """Write the key/value pairs of ``env_file`` to ``output`` as a dict literal.
+
+    :param env_file: Path to the .env file to compile
+    :param output: Path of the generated Python module
+    :returns: Number of variables written
+    """
+    values = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+    output.write_text(f"{HEADER}ENV = {pformat(values, width=120)}\n")
+    return len(values)
+
+
+if __name__ == "__main__":
+    if not ENV_FILE_PATH.exists():
+        sys.exit(f"No .env file found at {ENV_FILE_PATH}")
+    count = dump_env()
+    print(f"Wrote {count} variables to {OUTPUT_PATH.relative_to(PROJECT_ROOT)}")
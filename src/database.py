@@ -1,13 +1,19 @@
+import threading
 from contextlib import contextmanager
 
 from src.db.factory import make_database
 
 _database = None
+_database_lock = threading.Lock()
+
 
 def get_database():
     global _database
     if _database is None:
-        _database = make_database()
+        with _database_lock:
+            # Re-check under the lock so concurrent first callers share one instance
+            if _database is None:
+                _database = make_database()
     return _database
 
 
@@ -15,4 +21,4 @@ def get_database():
 def get_db_session():
     database = get_database()
     with database.get_session() as session:
-        yield session
\ No newline at end of file
+        yield session
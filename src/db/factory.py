@@ -11,6 +11,9 @@ def make_database() -> BaseDatabase:
         echo_sql=settings.postgres_echo_sql,
         pool_size=settings.postgres_pool_size,
         max_overflow=settings.postgres_max_overflow,
+        pool_recycle=settings.postgres_pool_recycle,
+        pool_pre_ping=settings.postgres_pool_pre_ping,
+        run_migrations=settings.postgres_run_migrations,
     )
 
     database = PostgreSQLDatabase(config=config)
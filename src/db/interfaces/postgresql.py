@@ -5,10 +5,9 @@ from typing import Generator, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
-from src.db.interfaces.base import BaseDatabase
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +20,10 @@ class PostgreSQLSettings(BaseSettings):
     )
     echo_sql: bool = Field(default=False, description="Enable SQL query logging")
     pool_size: int = Field(default=20, description="Database connection pool size")
-    max_overflow: int = Field(default=0, description="Maximum pool overflow")
+    max_overflow: int = Field(default=10, description="Maximum pool overflow")
+    pool_recycle: int = Field(default=1800, description="Recycle pooled connections older than this many seconds")
+    pool_pre_ping: bool = Field(default=False, description="Ping connections on checkout to detect stale ones")
+    run_migrations: bool = Field(default=False, description="Create missing tables on startup")
 
     class Config:
         env_prefix = "POSTGRES_"
@@ -30,8 +32,8 @@ class PostgreSQLSettings(BaseSettings):
 Base = declarative_base()
 
 
-class PostgreSQLDatabase(BaseDatabase):
-    """PostgreSQL database implementation."""
+class PostgreSQLDatabase:
+    """PostgreSQL database implementation (satisfies the BaseDatabase protocol)."""
 
     def __init__(self, config: PostgreSQLSettings):
         self.config = config
@@ -51,43 +53,49 @@ class PostgreSQLDatabase(BaseDatabase):
                 echo=self.config.echo_sql,
                 pool_size=self.config.pool_size,
                 max_overflow=self.config.max_overflow,
-                pool_pre_ping=True,  # Verify connections before use
+                pool_recycle=self.config.pool_recycle,
+                pool_pre_ping=self.config.pool_pre_ping,
             )
 
             self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
 
-            # Test the connection
-            assert self.engine is not None
-            with self.engine.connect() as conn:
+            # Probe, reflect and create tables over a single connection
+            with self.engine.begin() as conn:
                 conn.execute(text("SELECT 1"))
                 logger.info("Database connection test successful")
 
-            # Check which tables exist before creating
-            inspector = inspect(self.engine)
-            existing_tables = inspector.get_table_names()
-
-            # Create tables if they don't exist (idempotent operation)
-            Base.metadata.create_all(bind=self.engine)
-
-            # Check if any new tables were created
-            updated_tables = inspector.get_table_names()
-            new_tables = set(updated_tables) - set(existing_tables)
-
-            if new_tables:
-                logger.info(f"Created new tables: {', '.join(new_tables)}")
-            else:
-                logger.info("All tables already exist - no new tables created")
+                if self.config.run_migrations:
+                    self._create_tables(conn)
+                else:
+                    logger.info("Skipping table creation (run_migrations disabled)")
 
             logger.info("PostgreSQL database initialized successfully")
-            assert self.engine is not None
             logger.info(f"Database: {self.engine.url.database}")
-            logger.info(f"Total tables: {', '.join(updated_tables) if updated_tables else 'None'}")
             logger.info("Database connection established")
 
         except Exception as e:
             logger.error(f"Failed to initialize PostgreSQL database: {e}")
             raise
 
+    def _create_tables(self, conn: Connection) -> None:
+        """Create mapped tables that do not exist yet."""
+        # Check which tables exist before creating
+        existing_tables = set(inspect(conn).get_table_names())
+
+        # Create tables if they don't exist (idempotent operation)
+        Base.metadata.create_all(bind=conn)
+
+        # create_all only adds mapped tables, so the diff needs no second reflection
+        new_tables = set(Base.metadata.tables.keys()) - existing_tables
+        updated_tables = sorted(existing_tables | new_tables)
+
+        if new_tables:
+            logger.info(f"Created new tables: {', '.join(new_tables)}")
+        else:
+            logger.info("All tables already exist - no new tables created")
+
+        logger.info(f"Total tables: {', '.join(updated_tables) if updated_tables else 'None'}")
+
     def teardown(self) -> None:
         """Close the database connection."""
         if self.engine:
@@ -1,17 +1,10 @@
-from functools import lru_cache
 from typing import Annotated, Generator
 
 from fastapi import Depends, Request
 from sqlalchemy.orm import Session
-from services.opensearch.client import OpenSearchClient
-from src.config import Settings
+from src.config import Settings, get_settings
 from src.db.interfaces.base import BaseDatabase
-
-
-@lru_cache
-def get_settings() -> Settings:
-    """Get application settings."""
-    return Settings()
+from src.services.opensearch.client import OpenSearchClient
 
 
 def get_request_settings(request: Request) -> Settings:
@@ -46,6 +39,6 @@ def get_pdf_parser(request: Request):
 SettingsDep = Annotated[Settings, Depends(get_settings)]
 DatabaseDep = Annotated[BaseDatabase, Depends(get_database)]
 SessionDep = Annotated[Session, Depends(get_db_session)]
-OpenSearchClientDep = Annotated[OpenSearchClient, Depends(get_opensearch_client)]
+OpenSearchDep = Annotated[OpenSearchClient, Depends(get_opensearch_client)]
 ArxivClientDep = Annotated[dict, Depends(get_arxiv_client)]
 PdfParserDep = Annotated[dict, Depends(get_pdf_parser)]
\ No newline at end of file
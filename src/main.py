@@ -1,6 +1,8 @@
+import gc
 import logging
 import os
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI
@@ -29,6 +31,9 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     app.state.settings = settings
 
+    # Create the PDF cache once at startup rather than on every settings build
+    Path(settings.arxiv.pdf_cache_dir).mkdir(parents=True, exist_ok=True)
+
     database = make_database()
     app.state.database = database
     logger.info("Database connected")
@@ -55,6 +60,11 @@ async def lifespan(app: FastAPI):
     app.state.pdf_parser = make_pdf_parser_service()
     logger.info("Services initialized: arXiv API client, PDF parser")
 
+    # Move long-lived startup objects (settings, clients, parser models) out of GC scans; collect startup garbage first
+    # so it isn't frozen along with them and kept forever
+    gc.collect()
+    gc.freeze()
+
     logger.info("API ready")
     yield
 
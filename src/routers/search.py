@@ -33,6 +33,7 @@ async def search_papers(request: SearchRequest, opensearch_client: OpenSearchDep
             from_=request.from_,
             categories=request.categories,
             latest_papers=request.latest_papers,
+            search_after=request.search_after,
         )
 
         # Convert results to response model
@@ -48,13 +49,22 @@ async def search_papers(request: SearchRequest, opensearch_client: OpenSearchDep
                     pdf_url=hit.get("pdf_url"),
                     score=hit.get("score", 0.0),
                     highlights=hit.get("highlights"),
+                    sort=hit.get("sort"),
                 )
             )
 
-        return SearchResponse(query=request.query, total=results.get("total", 0), hits=hits, error=results.get("error"))
+        return SearchResponse(
+            query=request.query,
+            total=results.get("total", 0),
+            total_is_lower_bound=results.get("total_is_lower_bound", False),
+            hits=hits,
+            error=results.get("error"),
+        )
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Search error: {e}")
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -11,6 +11,9 @@ class SearchRequest(BaseModel):
     from_: int = Field(default=0, ge=0, alias="from", description="Offset for pagination")
     categories: Optional[List[str]] = Field(default=None, description="Filter by categories")
     latest_papers: bool = Field(default=False, description="Sort by publication date (newest first) instead of relevance")
+    search_after: Optional[List[Any]] = Field(
+        default=None, description="Sort values of the last hit of the previous page; continues after it and ignores from"
+    )
 
 
 class SearchHit(BaseModel):
@@ -24,6 +27,7 @@ class SearchHit(BaseModel):
     pdf_url: Optional[str]
     score: float
     highlights: Optional[dict] = None
+    sort: Optional[List[Any]] = None
 
 
 class SearchResponse(BaseModel):
@@ -31,5 +35,8 @@ class SearchResponse(BaseModel):
 
     query: str
     total: int
+    total_is_lower_bound: bool = Field(
+        default=False, description="True when more hits matched than were counted; total is then a lower bound"
+    )
     hits: List[SearchHit]
     error: Optional[str] = None
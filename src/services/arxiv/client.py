@@ -4,7 +4,7 @@ import time
 import xml.etree.ElementTree as ET
 from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional
 from urllib.parse import quote, urlencode
 
 import httpx
@@ -34,7 +34,7 @@ class ArxivClient:
         return self._settings.base_url
 
     @property
-    def namespaces(self) -> dict:
+    def namespaces(self) -> Mapping[str, str]:
         return self._settings.namespaces
 
     @property
@@ -421,7 +421,7 @@ class MetadataFetcher:
         Returns:
             Number of papers successfully indexed
         """
-        indexed_count = 0
+        documents = []
 
         for paper in papers:
             try:
@@ -448,15 +448,13 @@ class MetadataFetcher:
                 else:
                     opensearch_data["raw_text"] = ""
 
-                # Index to OpenSearch
-                if self.opensearch_client.index_paper(opensearch_data):
-                    indexed_count += 1
-                    logger.debug(f"Indexed paper {paper.arxiv_id} to OpenSearch")
-                else:
-                    logger.warning(f"Failed to index paper {paper.arxiv_id} to OpenSearch")
+                documents.append(opensearch_data)
 
             except Exception as e:
-                logger.error(f"Error indexing paper {paper.arxiv_id} to OpenSearch: {e}")
+                logger.error(f"Error preparing paper {paper.arxiv_id} for OpenSearch: {e}")
+
+        # Index in bulk requests with a single refresh, so the papers are searchable on return
+        indexed_count = self.opensearch_client.bulk_index_papers(documents)["success"] if documents else 0
 
         logger.info(f"Indexed {indexed_count}/{len(papers)} papers to OpenSearch")
         return indexed_count
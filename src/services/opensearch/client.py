@@ -1,14 +1,23 @@
 import logging
+import time
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypedDict, Union
 
-from opensearchpy import OpenSearch
-from opensearchpy.exceptions import NotFoundError, RequestError, OpenSearchException
+import orjson
+from opensearchpy import OpenSearch, helpers
+from opensearchpy.exceptions import NotFoundError, RequestError, OpenSearchException, SerializationError
+from opensearchpy.serializer import JSONSerializer
 from src.config import Settings, get_settings
 
 from .index_config import ARXIV_PAPERS_INDEX, ARXIV_PAPERS_MAPPING
-from .query_builder import PaperQueryBuilder
+from .query_builder import (
+    TRACK_TOTAL_HITS_CAP,
+    PaperQueryBuilder,
+    build_msearch_body,
+    build_search_query_json,
+    build_search_request_params,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +32,7 @@ class IndexStats(TypedDict):
 
 class SearchResult(TypedDict):
     total: int
+    total_is_lower_bound: bool
     hits: List[Dict[str, Any]]
     error: Optional[str]
 
@@ -32,6 +42,27 @@ class BulkIndexResult(TypedDict):
     failed: int
 
 
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer backed by orjson for faster request and response encoding."""
+
+    def loads(self, s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
+    def dumps(self, data: Any) -> Any:
+        # Pre-serialized bodies are passed through untouched
+        if isinstance(data, (str, bytes)):
+            return data
+
+        try:
+            # opensearch-py joins bulk/msearch lines as text, so return str
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError as e:
+            raise SerializationError(data, e)
+
+
 class OpenSearchClient:
     """
     Client for OpenSearch operations including index management and search.
@@ -58,14 +89,26 @@ class OpenSearchClient:
         self.settings = settings or get_settings()
         self.index_name = self.settings.opensearch.index_name or ARXIV_PAPERS_INDEX
 
+        # Short-lived cache for status calls polled by health probes
+        self._status_cache_ttl = self.settings.opensearch.status_cache_ttl
+        self._status_cache: Dict[str, Tuple[float, Any]] = {}
+
         self.client = self._create_client(host)
         logger.info("OpenSearch client initialized with host: %s, index: %s", host, self.index_name)
 
     def _create_client(self, host: str) -> OpenSearch:
-        """Create OpenSearch client with proper configuration."""
+        """Create OpenSearch client with proper configuration.
+
+        The connection pool is sized for concurrent ingestion so sockets are
+        kept alive and reused instead of reconnecting per request.
+        """
         return OpenSearch(
             hosts=[host],
             http_compress=True,
+            maxsize=max(self.settings.arxiv.max_concurrent_downloads, 20),
+            timeout=30,
+            retry_on_timeout=True,
+            serializer=OrjsonSerializer(),
             use_ssl=False,
             verify_certs=False,
             ssl_assert_hostname=False,
@@ -142,7 +185,6 @@ class OpenSearchClient:
                 index=self.index_name,
                 id=validated_data["arxiv_id"],
                 body=validated_data,
-                refresh=True,
             )
 
             success = response.get("result") in ["created", "updated"]
@@ -157,41 +199,91 @@ class OpenSearchClient:
             logger.error("Error indexing paper %s: %s", paper_data.get("arxiv_id", "unknown"), e)
             return False
 
-    def _prepare_paper_data(self, paper_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Prepare and validate paper data for indexing."""
+    def _prepare_paper_data(self, paper_data: Dict[str, Any], now: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Prepare and validate paper data for indexing.
+
+        Args:
+            paper_data: Paper data to prepare (not modified)
+            now: ISO timestamp for missing created_at/updated_at (current time if None)
+        """
         if "arxiv_id" not in paper_data:
             logger.error("Missing arxiv_id in paper data")
             return None
 
-        # Create a copy to avoid modifying original
-        prepared_data = paper_data.copy()
-        now = datetime.now(timezone.utc).isoformat()
+        if now is None:
+            now = datetime.now(timezone.utc).isoformat()
+
+        # Copy with timestamp defaults in one merge; caller-supplied values win
+        prepared = {"created_at": now, "updated_at": now, **paper_data}
+        self._normalize_authors(prepared)
+        return prepared
 
-        prepared_data.setdefault("created_at", now)
-        prepared_data.setdefault("updated_at", now)
+    def _prepare_paper_data_inplace(self, paper_data: Dict[str, Any], now: str) -> Optional[Dict[str, Any]]:
+        """Prepare and validate paper data for indexing, mutating ``paper_data``.
+
+        Used by the bulk path, where input dicts are transient and one
+        timestamp is shared by the whole batch.
+        """
+        if "arxiv_id" not in paper_data:
+            logger.error("Missing arxiv_id in paper data")
+            return None
 
-        # Normalize authors field
-        if isinstance(prepared_data.get("authors"), list):
-            prepared_data["authors"] = ", ".join(prepared_data["authors"])
+        paper_data.setdefault("created_at", now)
+        paper_data.setdefault("updated_at", now)
+        self._normalize_authors(paper_data)
 
-        return prepared_data
+        return paper_data
+
+    @staticmethod
+    def _normalize_authors(paper_data: Dict[str, Any]) -> None:
+        """Join a list of authors into the comma-separated string the index expects."""
+        if isinstance(paper_data.get("authors"), list):
+            paper_data["authors"] = ", ".join(paper_data["authors"])
 
     def bulk_index_papers(self, papers: List[Dict[str, Any]]) -> BulkIndexResult:
         """Bulk index multiple papers.
 
         Args:
-            papers: List of paper data to index
+            papers: List of paper data to index (prepared in place)
 
         Returns:
             Dictionary with counts of successful and failed indexing
         """
         results: BulkIndexResult = {"success": 0, "failed": 0}
+        now = datetime.now(timezone.utc).isoformat()
 
-        for paper in papers:
-            if self.index_paper(paper):
-                results["success"] += 1
-            else:
-                results["failed"] += 1
+        def _actions() -> Iterator[Dict[str, Any]]:
+            for paper in papers:
+                prepared_data = self._prepare_paper_data_inplace(paper, now)
+                if not prepared_data:
+                    results["failed"] += 1
+                    continue
+                yield {
+                    "_op_type": "index",
+                    "_index": self.index_name,
+                    "_id": prepared_data["arxiv_id"],
+                    "_source": prepared_data,
+                }
+
+        try:
+            success, errors = helpers.bulk(
+                self.client,
+                _actions(),
+                chunk_size=500,
+                request_timeout=60,
+                refresh=False,
+                raise_on_error=False,
+            )
+            results["success"] += success
+            results["failed"] += len(errors)
+            for error in errors:
+                logger.error("Failed to index paper: %s", error)
+
+            # Refresh once for the whole batch instead of per document
+            self.client.indices.refresh(index=self.index_name)
+        except OpenSearchException as e:
+            logger.error("Error bulk indexing papers: %s", e)
+            results["failed"] = len(papers) - results["success"]
 
         logger.info(
             "Bulk indexing complete: %d successful, %d failed",
@@ -207,8 +299,9 @@ class OpenSearchClient:
         from_: int = 0,
         fields: Optional[List[str]] = None,
         categories: Optional[List[str]] = None,
-        track_total_hits: bool = True,
+        track_total_hits: Union[bool, int] = TRACK_TOTAL_HITS_CAP,
         latest_papers: bool = False,
+        search_after: Optional[List[Any]] = None,
     ) -> SearchResult:
         """Search papers using BM25 scoring with query builder.
 
@@ -218,59 +311,159 @@ class OpenSearchClient:
             from_: Offset for pagination
             fields: List of fields to search in (default: title, abstract, authors)
             categories: Filter by categories
-            track_total_hits: Whether to track total hits accurately
+            track_total_hits: Hit-count cap, or True for an exact total
             latest_papers: Sort by publication date instead of relevance
+            search_after: Sort values of the last hit of the previous page; replaces from_
 
         Returns:
             Search results with hits and metadata
         """
         try:
-            query_builder = PaperQueryBuilder(
-                query=query,
-                size=size,
-                from_=from_,
-                fields=fields,
-                categories=categories,
-                track_total_hits=track_total_hits,
-                latest_papers=latest_papers,
+            search_body = self._build_search_body(
+                query, size, from_, fields, categories, track_total_hits, latest_papers, search_after
+            )
+            response = self.client.search(
+                index=self.index_name,
+                body=search_body,
+                **build_search_request_params(query, size),
             )
-
-            search_body = query_builder.build()
-            response = self.client.search(index=self.index_name, body=search_body)
 
             results = self._format_search_results(response, query)
             return results
 
         except NotFoundError:
             logger.error("Index %s not found", self.index_name)
-            return {"total": 0, "hits": [], "error": "Index not found"}
+            return {"total": 0, "total_is_lower_bound": False, "hits": [], "error": "Index not found"}
         except OpenSearchException as e:
             logger.error("Search error: %s", e)
-            return {"total": 0, "hits": [], "error": str(e)}
+            return {"total": 0, "total_is_lower_bound": False, "hits": [], "error": str(e)}
+
+    def search_papers_multi(
+        self,
+        queries: List[str],
+        size: int = 10,
+        from_: int = 0,
+        fields: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        track_total_hits: Union[bool, int] = TRACK_TOTAL_HITS_CAP,
+        latest_papers: bool = False,
+    ) -> List[SearchResult]:
+        """Run several searches in a single _msearch round trip.
+
+        Args:
+            queries: Search query texts, one search per entry
+            size: Number of results to return per query
+            from_: Offset for pagination
+            fields: List of fields to search in (default: title, abstract, authors)
+            categories: Filter by categories
+            track_total_hits: Hit-count cap, or True for an exact total
+            latest_papers: Sort by publication date instead of relevance
+
+        Returns:
+            One search result per query, in the same order as ``queries``
+        """
+        if not queries:
+            return []
+
+        try:
+            specs = [
+                {
+                    "query": query,
+                    "size": size,
+                    "from_": from_,
+                    "fields": fields,
+                    "categories": categories,
+                    "track_total_hits": track_total_hits,
+                    "latest_papers": latest_papers,
+                }
+                for query in queries
+            ]
+            body = build_msearch_body(specs, self.index_name)
+            response = self.client.msearch(body=body)
+
+            results: List[SearchResult] = []
+            for query, item in zip(queries, response["responses"]):
+                if "error" in item:
+                    logger.error("Search error for '%s': %s", query, item["error"])
+                    results.append({"total": 0, "total_is_lower_bound": False, "hits": [], "error": str(item["error"])})
+                else:
+                    results.append(self._format_search_results(item, query))
+            return results
+
+        except OpenSearchException as e:
+            logger.error("Multi-search error: %s", e)
+            return [{"total": 0, "total_is_lower_bound": False, "hits": [], "error": str(e)} for _ in queries]
+
+    def _build_search_body(
+        self,
+        query: str,
+        size: int,
+        from_: int,
+        fields: Optional[List[str]],
+        categories: Optional[List[str]],
+        track_total_hits: Union[bool, int],
+        latest_papers: bool,
+        search_after: Optional[List[Any]] = None,
+    ) -> bytes:
+        """Build a serialized search request body (cached per parameter set by the query builder)."""
+        if search_after is not None:
+            # Cursors are unique per page, so these bodies bypass the cache
+            return PaperQueryBuilder(
+                query=query,
+                size=size,
+                fields=fields,
+                categories=categories,
+                track_total_hits=track_total_hits,
+                latest_papers=latest_papers,
+                search_after=search_after,
+            ).to_json()
+
+        return build_search_query_json(
+            query=query,
+            size=size,
+            from_=from_,
+            categories=categories,
+            fields=fields,
+            latest_papers=latest_papers,
+            track_total_hits=track_total_hits,
+        )
 
     def _format_search_results(self, response: Dict[str, Any], query: str) -> SearchResult:
         """Format raw search response into SearchResult."""
         total = response["hits"]["total"]["value"]
+        # "gte" when counting stopped at the track_total_hits cap
+        total_is_lower_bound = response["hits"]["total"].get("relation") == "gte"
         hits = []
 
         for hit in response["hits"]["hits"]:
             paper = hit["_source"]
-            paper["score"] = hit["_score"]
+            paper["score"] = hit.get("_score") or 0.0
 
             if "highlight" in hit:
                 paper["highlights"] = hit["highlight"]
 
+            # Sort values are the cursor for the next search_after page
+            if "sort" in hit:
+                paper["sort"] = hit["sort"]
+
             hits.append(paper)
 
         logger.info("Search for '%s' returned %d results", query, total)
-        return {"total": total, "hits": hits, "error": None}
+        return {"total": total, "total_is_lower_bound": total_is_lower_bound, "hits": hits, "error": None}
 
-    def get_index_stats(self) -> IndexStats:
+    def get_index_stats(self, force: bool = False) -> IndexStats:
         """Get statistics about the index.
 
+        Args:
+            force: Bypass the short-lived status cache
+
         Returns:
             Dictionary with index statistics
         """
+        return self._get_cached_status("index_stats", self._fetch_index_stats, force)
+
+    def _fetch_index_stats(self) -> IndexStats:
+        """Query index statistics from the cluster."""
         try:
             stats = self.client.indices.stats(index=self.index_name)
             count = self.client.count(index=self.index_name)
@@ -286,12 +479,19 @@ class OpenSearchClient:
             logger.error("Error getting index stats: %s", e)
             raise
 
-    def health_check(self) -> bool:
+    def health_check(self, force: bool = False) -> bool:
         """Check if OpenSearch is healthy and accessible.
 
+        Args:
+            force: Bypass the short-lived status cache
+
         Returns:
             True if healthy, False otherwise
         """
+        return self._get_cached_status("health", self._fetch_health, force)
+
+    def _fetch_health(self) -> bool:
+        """Query cluster health from the cluster."""
         try:
             health = self.client.cluster.health()
             return health["status"] in ["green", "yellow"]
@@ -299,6 +499,17 @@ class OpenSearchClient:
             logger.error("Health check failed: %s", e)
             return False
 
+    def _get_cached_status(self, key: str, fetch: Callable[[], Any], force: bool) -> Any:
+        """Return the cached result for ``key`` if still fresh, else call ``fetch``."""
+        now = time.monotonic()
+        cached = self._status_cache.get(key)
+        if not force and cached is not None and now - cached[0] < self._status_cache_ttl:
+            return cached[1]
+
+        value = fetch()
+        self._status_cache[key] = (now, value)
+        return value
+
     def get_cluster_info(self) -> Dict[str, Any]:
         """Get OpenSearch cluster information.
 
@@ -2,12 +2,12 @@ from functools import lru_cache
 
 from src.config import get_settings
 
-from .client import OpensearchClient
+from .client import OpenSearchClient
 
 @lru_cache(maxsize=1)
-def make_opensearch_client() -> OpensearchClient:
+def make_opensearch_client() -> OpenSearchClient:
     settings = get_settings()
-    return OpensearchClient(
+    return OpenSearchClient(
         host=settings.opensearch.host,
         settings=settings
     )
\ No newline at end of file
@@ -21,7 +21,7 @@ ARXIV_PAPERS_MAPPING = {
         "dynamic": "strict",
         "properties": {
             "arxiv_id": {"type": "keyword"},
-            "title": {"type": "text", "analyzer": "text_analyzer", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}}},
+            "title": {"type": "text", "analyzer": "text_analyzer", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}},
             "authors": {"type": "text", "analyzer": "text_analyzer", "fields": {"keyword": {"type": "keyword", "ignore_above": 256}}},
             "abstract": {"type": "text", "analyzer": "text_analyzer"},
             "categories": {"type": "keyword"},
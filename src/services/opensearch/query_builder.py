@@ -1,140 +1,353 @@
-import logging 
-from typing import Any,Dict,List,Optional
+import logging
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Static parts of every search body, shared by reference instead of rebuilt per query.
+# They are serialized, never mutated, by the OpenSearch client.
+_SOURCE_FIELDS = ("arxiv_id", "title", "authors", "abstract", "categories", "published_date", "pdf_url")
+
+_HIGHLIGHT_BODY = {
+    "fields": {
+        "title": {
+            "number_of_fragments": 0,
+        },
+        "abstract": {
+            "fragment_size": 120,
+            "number_of_fragments": 1,
+            "pre_tags": ["<mark>"],
+            "post_tags": ["</mark>"],
+        },
+    },
+    "require_field_match": False,
+}
+
+# Bounds on user query text; long or pathological input blows up fuzzy automata
+MAX_QUERY_TERMS = 32
+MAX_TERM_LENGTH = 64
+
+_CONTROL_CHARS = re.compile(r"[\x00-\x1f\x7f]")
+
+# Default boosted search fields; interned tuples so builders and cache keys share them
+_DEFAULT_FIELDS = (sys.intern("title^3"), sys.intern("abstract^2"), sys.intern("authors^1"))
+
+# Fields that get fuzzy matching in text queries
+_FUZZY_FIELDS = frozenset({"title"})
+
+# OpenSearch's default index.max_result_window
+MAX_RESULT_WINDOW = 10_000
+
+# Largest page a single search may request; bigger sizes are clamped
+MAX_PAGE_SIZE = 100
+
+# Default hit-count cap: counting stops here (reported as "gte"), which lets
+# shards skip non-competitive blocks. Pass track_total_hits=True for exact totals.
+TRACK_TOTAL_HITS_CAP = 10_000
+
+PIT_KEEP_ALIVE = "1m"
+
+# Sort clauses are constants shared by reference; the client only serializes them.
+# Both end in the unique arxiv_id so the order is total and any page's sort values
+# can seed search_after for the next one.
+_DATE_DESC_SORT = [{"published_date": {"order": "desc"}}, "_score", {"arxiv_id": {"order": "asc"}}]
+_SCORE_SORT = ["_score", {"arxiv_id": {"order": "asc"}}]
+
+_BASE_BODY_TEMPLATE = {
+    "_source": _SOURCE_FIELDS,
+    "highlight": _HIGHLIGHT_BODY,
+}
+
+
 class PaperQueryBuilder:
+    __slots__ = (
+        "query",
+        "size",
+        "from_",
+        "fields",
+        "categories",
+        "track_total_hits",
+        "latest_papers",
+        "search_after",
+        "pit_id",
+        "highlight",
+    )
+
     def __init__(
             self,
-            query: str = None,
+            query: Optional[str] = None,
             size: int = 10,
             from_: int = 0,
-            fields: Optional[List[str]] = None,
-            categories: Optional[List[str]] = None,
-            track_total_hits: bool = True,
+            fields: Optional[Sequence[str]] = None,
+            categories: Optional[Sequence[str]] = None,
+            track_total_hits: Union[bool, int] = TRACK_TOTAL_HITS_CAP,
             latest_papers: bool = False,
+            search_after: Optional[List[Any]] = None,
+            pit_id: Optional[str] = None,
+            highlight: bool = True,
     ):
-        self.query = query
+        size = min(size, MAX_PAGE_SIZE)
+
+        # Deep from/size paging makes every shard collect and discard from_ hits;
+        # past the result window callers must page with search_after instead.
+        if search_after is None and from_ + size > MAX_RESULT_WINDOW:
+            raise ValueError(
+                f"from_ + size must not exceed {MAX_RESULT_WINDOW}; use search_after to paginate deeper"
+            )
+
+        self.query = _normalize_query(query)
         self.size = size
         self.from_ = from_
-        self.fields = fields or ["title^3","abstract^2","authors^1"]
-        self.categories = categories
+        self.fields = _intern_all(fields) or _DEFAULT_FIELDS
+        self.categories = _intern_all(categories)
         self.track_total_hits = track_total_hits
         self.latest_papers = latest_papers
+        self.search_after = search_after
+        self.pit_id = pit_id
+        self.highlight = highlight
 
     def build(self) -> Dict[str, Any]:
-        query_body = {
-            "query": self._build_query(),
-            "size": self.size,
-            "from": self.from_,
-            "track_total_hits": self.track_total_hits,
-            "_source": self._build_source_fields(),
-            "highlight": self._build_highlight(),
-        }
-
-       sort = self._build_sort()
-       if sort:
-           query_body["sort"] = sort
+        # Shallow copy of the shared skeleton, then overwrite the per-query keys
+        query_body = _BASE_BODY_TEMPLATE.copy()
+        query_body["query"] = self._build_query()
+        query_body["size"] = self.size
+        query_body["track_total_hits"] = self.track_total_hits
+
+        # List views that don't render previews can skip highlighting entirely
+        if not self.highlight:
+            del query_body["highlight"]
+
+        if self.search_after is not None:
+            query_body["search_after"] = self.search_after
+        else:
+            query_body["from"] = self.from_
+
+        if self.pit_id:
+            query_body["pit"] = {"id": self.pit_id, "keep_alive": PIT_KEEP_ALIVE}
+
+        query_body["sort"] = self._build_sort()
+        # Any sort beyond a lone _score is a field sort, which leaves hit _score null unless asked
+        query_body["track_scores"] = True
 
         return query_body
 
-    def _build_query(self) -> Dict[str, Any]:
+    def to_json(self) -> bytes:
+        """Build the body and serialize it with orjson."""
+        return orjson.dumps(self.build())
 
-        must_clauses = []
+    def build_request_params(self, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """Build search URL parameters that steer shard-level caching and routing.
 
-        if self.query.strip():
-            must_clauses.append(self._build_text_query())
+        Args:
+            user_id: Stable token to pin a user's searches to the same shard copies
+        """
+        params: Dict[str, Any] = {"request_cache": self._is_cacheable()}
+        # A point-in-time search is already pinned to its PIT's shard copies and
+        # OpenSearch rejects a preference alongside it
+        if not self.pit_id:
+            params["preference"] = user_id or "_local"
+        return params
 
-        filter_clauses = {}
+    def _is_cacheable(self) -> bool:
+        return _is_cacheable(self.query, self.size)
 
-        bool_query = {}
+    def _build_query(self) -> Dict[str, Any]:
+        # Normalized queries are None, "" or whitespace-free at the ends
+        has_text = bool(self.query)
 
-        if must_clauses:
-            bool_query["must"] = must_clauses
-        else:
-            bool_query["must"] = [{"match_all": {}}]
+        # Skip the bool wrapper (and its scorer) when only one side is present
+        if not has_text and not self.categories:
+            return {"match_all": {}}
+        if not has_text:
+            return {"constant_score": {"filter": {"terms": {"categories": self.categories}}}}
 
+        bool_query = {"must": [self._build_text_query()]}
+
+        filter_clauses = self._build_filters()
         if filter_clauses:
             bool_query["filter"] = filter_clauses
 
         return {"bool": bool_query}
     
     def _build_text_query(self) -> Dict[str, Any]:
+        # Fuzzy matching is limited to short queries on short fields; on the
+        # abstract it dominates query cost for little recall gain.
+        allow_fuzzy = len(self.query.split()) <= 3
+
+        queries = []
+        for field_spec in self.fields:
+            field, _, boost = field_spec.partition("^")
+            match = {"query": self.query, "boost": float(boost) if boost else 1.0}
+            if allow_fuzzy and field in _FUZZY_FIELDS:
+                # No fuzzy expansion for terms under 4 chars, one edit up to 7, two beyond
+                match["fuzziness"] = "AUTO:4,7"
+                match["prefix_length"] = 2
+                match["max_expansions"] = 50
+            queries.append({"match": {field: match}})
+
+        return {"dis_max": {"tie_breaker": 0.3, "queries": queries}}
 
-        return {
-            "multi_match": {
-                "query": self.query,
-                "fields": self.fields,
-                "type": "best_fields",
-                "operator": "or",
-                "fuzziness": "AUTO",
-                "prefix_length": 2,
-            }
-        }
-    
     def _build_filters(self) -> List[Dict[str, Any]]:
         filters = []
 
         if self.categories:
-            filters.append({"terms": {"categories": self.categories}})
+            # Non-scoring filter clauses are eligible for the shard-level query cache
+            filters.append({"constant_score": {"filter": {"terms": {"categories": self.categories}}}})
 
         return filters
     
-    def _build_source_fields(self) -> List[str]:
-        return [
-            "arxiv_id",
-            "title",
-            "authors",
-            "abstract",
-            "authors",
-            "categories",
-            "published_date",
-            "pdf_url",
-        ]
-    
-    def _build_highlight(self) -> Dict[str, Any]:
-
-        return {
-            "fields": {
-                "title"; {
-                    "fragment_size": 0,
-                    "number_of_fragments": 0,
-                },
-                "abstract": {
-                    "fragment_size": 150,
-                    "number_of_fragments": 3,
-                    "pre_tags": ["<mark>"],
-                    "post_tags": ["</mark>"],
-                },
-                "authors": {
-                    "fragment_size": 0,
-                    "number_of_fragments": 0,
-                    "pre_tags": ["<mark>"],
-                    "post_tags": ["</mark>"],
-                },
-            },
-            "require_field_match": False,
-        }
-
-    def _build_sort(self) -> Optional[List[Dict[str, Any]]]:
-        if self.latest_papers:
-            return [{"published_date": {"order": "desc"}},"_score"]
-        
-        if self.query.strip():
-            return None
-        
-        return [{"published_date": {"order": "desc"}},"_score"]
-    
-    def build_search_query(
-            query: str,
-            size: int = 10,
-            from_: int = 0,
-            categories: Optional[List[str]] = None,
-    ) -> Dict[str, Any]:
-        builder = PaperQueryBuilder(
-            query=query,
-            size=size,
-            from_=from_,
-            categories=categories,
-        )
-        return builder.build()
\ No newline at end of file
+    def _build_sort(self) -> List[Any]:
+        if self.latest_papers or not self.query:
+            return _DATE_DESC_SORT
+        return _SCORE_SORT
+
+
+def _normalize_query(query: Optional[str]) -> Optional[str]:
+    """Strip control characters, drop overlong tokens and cap the number of terms.
+
+    Raises ValueError when non-blank text has no term left after that.
+    """
+    if not query:
+        return query
+
+    terms = [term for term in _CONTROL_CHARS.sub(" ", query).split() if len(term) <= MAX_TERM_LENGTH]
+
+    # Text that had content but lost all of it must not turn into a match-all search
+    if not terms and query.strip():
+        raise ValueError(f"Query has no searchable terms; each term must be at most {MAX_TERM_LENGTH} characters")
+
+    return " ".join(terms[:MAX_QUERY_TERMS])
+
+
+def build_search_query(
+        query: str,
+        size: int = 10,
+        from_: int = 0,
+        categories: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        latest_papers: bool = False,
+        track_total_hits: Union[bool, int] = TRACK_TOTAL_HITS_CAP,
+        highlight: bool = True,
+) -> Dict[str, Any]:
+    """Build a search body as a dict.
+
+    Bodies headed for the OpenSearch client should come from
+    build_search_query_json, which caches the serialized result.
+    """
+    return _builder_for_key(
+        _cache_key(query, size, from_, categories, fields, latest_papers, track_total_hits, highlight)
+    ).build()
+
+
+def build_search_query_json(
+        query: str,
+        size: int = 10,
+        from_: int = 0,
+        categories: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        latest_papers: bool = False,
+        track_total_hits: Union[bool, int] = TRACK_TOTAL_HITS_CAP,
+        highlight: bool = True,
+) -> bytes:
+    """Like build_search_query, but returns the orjson-serialized body, cached per parameter set.
+
+    Pass the bytes as ``body=`` to the OpenSearch client; pre-serialized
+    bodies are sent as-is without another JSON encoding pass.
+    """
+    return _build_cached_json(
+        _cache_key(query, size, from_, categories, fields, latest_papers, track_total_hits, highlight)
+    )
+
+
+def build_msearch_body(specs: List[Dict[str, Any]], index: str) -> bytes:
+    """Build an NDJSON ``_msearch`` payload for several searches against ``index``.
+
+    Each spec holds PaperQueryBuilder keyword arguments. The result can be
+    passed straight to ``OpenSearch.msearch(body=...)``.
+    """
+    buf = bytearray()
+    for spec in specs:
+        builder = PaperQueryBuilder(**spec)
+        # PIT searches carry their index in the PIT and must not name one
+        header = {} if builder.pit_id else {"index": index}
+        header.update(builder.build_request_params())
+        buf += orjson.dumps(header)
+        buf += b"\n"
+        buf += builder.to_json()
+        buf += b"\n"
+    return bytes(buf)
+
+
+def build_search_request_params(query: str, size: int = 10, user_id: Optional[str] = None) -> Dict[str, Any]:
+    """Request parameters for a search, without building the body.
+
+    Pairs with build_search_query/build_search_query_json, whose cached
+    bodies don't carry a builder instance.
+    """
+    return {"request_cache": _is_cacheable_cached(query, size), "preference": user_id or "_local"}
+
+
+def _is_cacheable(query: Optional[str], size: int) -> bool:
+    # The shard request cache only pays off for filter-only/match-all and count-only searches
+    return not query or size == 0
+
+
+@lru_cache(maxsize=1024)
+def _is_cacheable_cached(query: Optional[str], size: int) -> bool:
+    return _is_cacheable(_normalize_query(query), min(size, MAX_PAGE_SIZE))
+
+
+# track_total_hits is keyed with its type: True == 1 and False == 0, but they
+# mean "exact count" and "no count" rather than a cap of 1 or 0
+_CacheKey = Tuple[
+    str, int, int, Optional[Tuple[str, ...]], Optional[Tuple[str, ...]], bool, Tuple[type, Union[bool, int]], bool
+]
+
+
+def _cache_key(
+        query: str,
+        size: int,
+        from_: int,
+        categories: Optional[List[str]],
+        fields: Optional[List[str]],
+        latest_papers: bool,
+        track_total_hits: Union[bool, int],
+        highlight: bool,
+) -> _CacheKey:
+    return (
+        query,
+        size,
+        from_,
+        _intern_all(fields),
+        _intern_all(categories),
+        latest_papers,
+        (type(track_total_hits), track_total_hits),
+        highlight,
+    )
+
+
+def _intern_all(values: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    return tuple(sys.intern(v) for v in values) if values else None
+
+
+def _builder_for_key(key: _CacheKey) -> "PaperQueryBuilder":
+    query, size, from_, fields, categories, latest_papers, (_, track_total_hits), highlight = key
+    return PaperQueryBuilder(
+        query=query,
+        size=size,
+        from_=from_,
+        fields=fields,
+        categories=categories,
+        track_total_hits=track_total_hits,
+        latest_papers=latest_papers,
+        highlight=highlight,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_cached_json(key: _CacheKey) -> bytes:
+    return _builder_for_key(key).to_json()